@@ -1,3 +1,4 @@
+import os
 import pygame
 import sys
 import time
@@ -7,16 +8,32 @@ from visualizer import Visualizer
 from voice_effects import VoiceEffectsManager
 from sound_manager import SoundManager
 
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    Window = Renderer = Texture = None
+
 class MindfulApp:
     def __init__(self):
         pygame.init()
         self.width = 800
         self.height = 900
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption("Mindful Voice")
+        self.use_gpu = os.getenv('MINDFUL_GPU') == '1' and Renderer is not None
+        
+        if self.use_gpu:
+            # The session view renders through SDL textures; the other pages are
+            # still drawn in software onto self.screen and uploaded each frame.
+            self.window = Window("Mindful Voice", size=(self.width, self.height))
+            self.renderer = Renderer(self.window)
+            self.screen = pygame.Surface((self.width, self.height), 0, 32)
+            self.screen_texture = Texture(self.renderer, (self.width, self.height), streaming=True)
+        else:
+            self.renderer = None
+            self.screen = pygame.display.set_mode((self.width, self.height))
+            pygame.display.set_caption("Mindful Voice")
         
         self.audio_processor = AudioProcessor()
-        self.visualizer = Visualizer(self.width, self.height)
+        self.visualizer = Visualizer(self.width, self.height, renderer=self.renderer)
         self.voice_effects = VoiceEffectsManager()
         self.sound_manager = SoundManager()
         
@@ -141,7 +158,7 @@ class MindfulApp:
     def stop_session(self):
         self.audio_processor.stop()
         pattern_data = {
-            'trails': [trail.copy() for trail in self.visualizer.trails],
+            'trails': self.visualizer.get_pattern_trails(),
             'category': self.category,
             'timestamp': datetime.now()
         }
@@ -178,7 +195,13 @@ class MindfulApp:
         elif self.state == 'patterns':
             self.draw_patterns_page()
         
-        pygame.display.flip()
+        if self.renderer is None:
+            pygame.display.flip()
+        else:
+            if self.state != 'running':
+                self.screen_texture.update(self.screen)
+                self.screen_texture.draw()
+            self.renderer.present()
 
     def run(self):
         running = True
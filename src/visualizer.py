@@ -5,17 +5,136 @@ import math
 from collections import deque
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from pygame._sdl2.video import Texture
+except ImportError:
+    Texture = None
+
+ORB_COLORS = [
+    (80, 180, 255),
+    (255, 80, 150),
+    (255, 200, 80),
+    (200, 255, 80),
+    (230, 130, 255)
+]
+GLOW_LEVELS = 16
+HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+TRAIL_LEN = 512
+PATTERN_HISTORY_LEN = 4096
+TRAIL_BUCKETS = 4
+TRAIL_STYLES = [
+    (max(4, int(8 * level)), int(255 * (0.5 + level * 0.5)))
+    for level in (b / (TRAIL_BUCKETS - 1) for b in range(TRAIL_BUCKETS))
+]
+# Dim the trail surface often enough that the faintest (quiet) segments last
+# TRAIL_LEN frames; brighter segments linger proportionally longer.
+TRAIL_FADE_STEP = 8
+TRAIL_FADE_INTERVAL = TRAIL_LEN // -(-TRAIL_STYLES[0][1] // TRAIL_FADE_STEP)
+
+SINCOS_LUT_SIZE = 4096
+SETTLE_EPSILON = 1e-3
+_SIN_LUT = np.sin(np.linspace(0, 2 * math.pi, SINCOS_LUT_SIZE + 1))
+_COS_LUT = np.cos(np.linspace(0, 2 * math.pi, SINCOS_LUT_SIZE + 1))
+
+def sincos(angles):
+    idx = angles * (SINCOS_LUT_SIZE / (2 * math.pi))
+    base = np.floor(idx)
+    frac = idx - base
+    i = base.astype(np.int64) & (SINCOS_LUT_SIZE - 1)
+    sin = _SIN_LUT[i] + frac * (_SIN_LUT[i + 1] - _SIN_LUT[i])
+    cos = _COS_LUT[i] + frac * (_COS_LUT[i + 1] - _COS_LUT[i])
+    return sin, cos
+
+def _integrate_numpy(angles, deviations, radial_v, xv, yv, angular_v, xs, ys,
+                     cx, cy, orbit_radius, spring, damping, attraction):
+    angles += angular_v
+    
+    radii = orbit_radius + deviations
+    sin, cos = sincos(angles)
+    xs[:] = cx + cos * radii
+    ys[:] = cy + sin * radii
+    
+    # Quiet and at rest: what is left of the motion would move an orb by at most
+    # SETTLE_EPSILON / sqrt(spring) (~0.01px), so skip the atan2/hypot re-derivation
+    if attraction == 0 and max(np.abs(deviations).max(), np.abs(radial_v).max(),
+                               np.abs(xv).max(), np.abs(yv).max()) < SETTLE_EPSILON:
+        return
+    
+    if attraction > 0:
+        dx = cx - xs
+        dy = cy - ys
+        dist = np.hypot(dx, dy)
+        xv += (dx/dist) * attraction
+        yv += (dy/dist) * attraction
+    
+    xs += xv
+    ys += yv
+    
+    offset_x = xs - cx
+    offset_y = ys - cy
+    angles[:] = np.arctan2(offset_y, offset_x)
+    deviations[:] = np.hypot(offset_x, offset_y) - orbit_radius
+    
+    xv *= damping
+    yv *= damping
+    
+    displaced = deviations != 0
+    radial_v[displaced] -= spring * deviations[displaced]
+    deviations[displaced] += radial_v[displaced]
+    radial_v[displaced] *= damping
+
+def _integrate_loop(angles, deviations, radial_v, xv, yv, angular_v, xs, ys,
+                    cx, cy, orbit_radius, spring, damping, attraction):
+    for i in range(angles.shape[0]):
+        angle = angles[i] + angular_v[i]
+        radius = orbit_radius + deviations[i]
+        x = cx + math.cos(angle) * radius
+        y = cy + math.sin(angle) * radius
+        
+        if attraction > 0:
+            dx = cx - x
+            dy = cy - y
+            dist = math.hypot(dx, dy)
+            xv[i] += (dx/dist) * attraction
+            yv[i] += (dy/dist) * attraction
+        
+        x += xv[i]
+        y += yv[i]
+        
+        angles[i] = math.atan2(y - cy, x - cx)
+        deviation = math.hypot(x - cx, y - cy) - orbit_radius
+        
+        xv[i] *= damping
+        yv[i] *= damping
+        
+        if deviation != 0:
+            radial_v[i] -= spring * deviation
+            deviation += radial_v[i]
+            radial_v[i] *= damping
+        
+        deviations[i] = deviation
+        xs[i] = x
+        ys[i] = y
+
+if njit is not None:
+    _integrate = njit(cache=True, fastmath=True)(_integrate_loop)
+else:
+    _integrate = _integrate_numpy
+
 class Visualizer:
-    def __init__(self, width, height):
+    def __init__(self, width, height, renderer=None, orb_colors=ORB_COLORS):
         self.width = width
         self.height = height
         self.center = (width // 2, height // 2)
         self.screenshot_mode = False
+        self.renderer = renderer
         
-        self.main_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.glow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         self.trail_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.blur_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
         self.orbit_radius = min(width, height) // 4
         self.center_orb_radius = 85
@@ -27,20 +146,47 @@ class Visualizer:
         self.damping = 0.98
         self.attraction_strength = 0.5
         
-        self.orbs = [
-            {'color': color, 'angle': angle, 'deviation': 0, 
-             'radial_velocity': 0, 'angular_velocity': self.base_speed,
-             'x_velocity': 0, 'y_velocity': 0}
-            for color, angle in [
-                ((80, 180, 255), 0),
-                ((255, 80, 150), 2*math.pi/5),
-                ((255, 200, 80), 4*math.pi/5),
-                ((200, 255, 80), 6*math.pi/5),
-                ((230, 130, 255), 8*math.pi/5)
-            ]
+        # Orb state is kept as parallel shape-(N,) arrays, one element per orb, so
+        # update() and draw() are whole-array operations regardless of N. Colors
+        # are shape (N, 3) uint8. Any new per-orb field should follow the same layout.
+        if len(orb_colors) == 0:
+            raise ValueError("orb_colors must contain at least one color")
+        self.num_orbs = len(orb_colors)
+        self.orb_colors = np.array(orb_colors, dtype=np.uint8)
+        self._orb_palette = self._color_palette(self.orb_colors)
+        self.orb_angles = np.arange(self.num_orbs) * (2 * math.pi / self.num_orbs)
+        self.orb_deviations = np.zeros(self.num_orbs, dtype=np.float64)
+        self.orb_radial_velocities = np.zeros(self.num_orbs, dtype=np.float64)
+        self.orb_angular_velocities = np.full(self.num_orbs, self.base_speed, dtype=np.float64)
+        self.orb_x_velocities = np.zeros(self.num_orbs, dtype=np.float64)
+        self.orb_y_velocities = np.zeros(self.num_orbs, dtype=np.float64)
+        self.orb_x = np.zeros(self.num_orbs, dtype=np.float64)
+        self.orb_y = np.zeros(self.num_orbs, dtype=np.float64)
+        
+        # RGBA trail color per orb and TRAIL_STYLES bucket
+        self._trail_colors = [
+            [(r, g, b, alpha) for _, alpha in TRAIL_STYLES]
+            for r, g, b in self.orb_colors.tolist()
         ]
         
-        self.trails = [[] for _ in range(len(self.orbs))]
+        if njit is not None:
+            # Compile (or load the cached build of) the integrator before the first frame
+            one = np.zeros(1, dtype=np.float64)
+            _integrate(one.copy(), one.copy(), one.copy(), one.copy(), one.copy(),
+                       one.copy(), one.copy(), one.copy(), 0.0, 0.0, 1.0, 0.0, 1.0, 0.0)
+        
+        self.trails = np.zeros((self.num_orbs, TRAIL_LEN, 3), dtype=np.float32)
+        self.trail_head = np.zeros(self.num_orbs, dtype=np.int32)
+        self._trail_drawn_head = 0
+        self._trail_frames = 0
+        
+        # Whole-session copy of the trails for saved patterns. When it fills up,
+        # every other point is dropped and the sampling stride doubles, so it
+        # always spans the full session within PATTERN_HISTORY_LEN points.
+        self.pattern_history = np.zeros((self.num_orbs, PATTERN_HISTORY_LEN, 3), dtype=np.float32)
+        self.pattern_count = 0
+        self.pattern_stride = 1
+        self._pattern_frames = 0
         self.back_button = pygame.Rect(20, 20, 40, 40)
         
         self.font_time = pygame.font.Font(None, 72)
@@ -51,6 +197,40 @@ class Visualizer:
         self.selection_pulse = 0
         self.glow_intensity = 0
         self.fade_alpha = 255
+        
+        self._glow_cache = {}
+        for color in ORB_COLORS:
+            for level in range(GLOW_LEVELS, 2 * GLOW_LEVELS + 1):
+                self.get_glow_sprite(color, 4, level / GLOW_LEVELS)
+            self.get_glow_sprite(color, 6, 1.0)
+        
+        disc_radius = self.center_orb_radius + 5
+        self._timer_disc = pygame.Surface((2 * disc_radius + 2, 2 * disc_radius + 2), pygame.SRCALPHA)
+        pygame.draw.circle(self._timer_disc, (20, 22, 25, 255), (disc_radius + 1, disc_radius + 1), disc_radius)
+        self._timer_disc = self._to_display_format(self._timer_disc)
+        self._timer_disc_pos = (self.center[0] - disc_radius - 1, self.center[1] - disc_radius - 1)
+        
+        if self.renderer is not None:
+            self._glow_textures = {}
+            self._trail_texture = Texture(self.renderer, (width, height), streaming=True)
+            self._trail_texture.blend_mode = pygame.BLENDMODE_BLEND
+            self._timer_disc_texture = Texture.from_surface(self.renderer, self._timer_disc)
+            back_button = pygame.Surface((self.back_button.right, self.back_button.bottom), pygame.SRCALPHA)
+            self.draw_back_button(back_button)
+            self._back_button_texture = Texture.from_surface(self.renderer, back_button)
+        
+        self._cached_category = None
+        self._cached_category_surface = None
+        self._cached_category_rect = None
+        self._cached_voice_surface = None
+        self._cached_voice_rect = None
+        self._cached_time_seconds = -1
+        self._cached_time_text = ''
+        self._cached_time_surface = None
+        self._cached_time_rect = None
+        self._cached_category_texture = None
+        self._cached_voice_texture = None
+        self._cached_time_texture = None
 
     def toggle_screenshot_mode(self):
         self.screenshot_mode = not self.screenshot_mode
@@ -64,122 +244,252 @@ class Visualizer:
         
         self.glow_intensity = min(1.0, self.glow_intensity + (intensity * 0.5))
         self.glow_intensity *= 0.95
+        if self.glow_intensity < 0.02:
+            self.glow_intensity = 0.0
         
-        for i, orb in enumerate(self.orbs):
-            orb['angle'] += orb['angular_velocity']
-            
-            radius = self.orbit_radius + orb['deviation']
-            current_x = self.center[0] + math.cos(orb['angle']) * radius
-            current_y = self.center[1] + math.sin(orb['angle']) * radius
-            
-            if intensity > 0:
-                dx = self.center[0] - current_x
-                dy = self.center[1] - current_y
-                dist = math.sqrt(dx*dx + dy*dy)
-                attraction = self.attraction_strength * intensity
-                
-                orb['x_velocity'] += (dx/dist) * attraction
-                orb['y_velocity'] += (dy/dist) * attraction
-            
-            current_x += orb['x_velocity']
-            current_y += orb['y_velocity']
-            
-            new_angle = math.atan2(current_y - self.center[1], current_x - self.center[0])
-            new_radius = math.sqrt((current_x - self.center[0])**2 + (current_y - self.center[1])**2)
-            orb['deviation'] = new_radius - self.orbit_radius
-            orb['angle'] = new_angle
-            
-            orb['x_velocity'] *= self.damping
-            orb['y_velocity'] *= self.damping
-            
-            if abs(orb['deviation']) > 0:
-                return_force = -self.spring_constant * orb['deviation']
-                orb['radial_velocity'] += return_force
-                orb['deviation'] += orb['radial_velocity']
-                orb['radial_velocity'] *= self.damping
-                
-            self.trails[i].append((current_x, current_y, intensity))
+        attraction = self.attraction_strength * intensity if intensity > 0 else 0.0
+        self._integrate_step(attraction)
+        
+        slots = self.trail_head % TRAIL_LEN
+        self.trails[np.arange(self.num_orbs), slots, 0] = self.orb_x
+        self.trails[np.arange(self.num_orbs), slots, 1] = self.orb_y
+        self.trails[np.arange(self.num_orbs), slots, 2] = intensity
+        self.trail_head += 1
+        self._record_pattern_point(slots)
         
         self.time += 0.016
         self.selection_pulse = (self.selection_pulse + 0.05) % (2 * math.pi)
 
+    def _record_pattern_point(self, slots):
+        if self._pattern_frames % self.pattern_stride == 0:
+            if self.pattern_count == PATTERN_HISTORY_LEN:
+                half = PATTERN_HISTORY_LEN // 2
+                self.pattern_history[:, :half] = self.pattern_history[:, ::2]
+                self.pattern_count = half
+                self.pattern_stride *= 2
+            self.pattern_history[:, self.pattern_count] = self.trails[np.arange(self.num_orbs), slots]
+            self.pattern_count += 1
+        self._pattern_frames += 1
+
+    def get_pattern_trails(self):
+        return [self.pattern_history[i, :self.pattern_count].copy() for i in range(self.num_orbs)]
+
+    def _integrate_step(self, attraction):
+        _integrate(self.orb_angles, self.orb_deviations, self.orb_radial_velocities,
+                   self.orb_x_velocities, self.orb_y_velocities, self.orb_angular_velocities,
+                   self.orb_x, self.orb_y, float(self.center[0]), float(self.center[1]),
+                   float(self.orbit_radius), self.spring_constant, self.damping, float(attraction))
+
     def draw_back_button(self, surface):
         pygame.draw.circle(surface, (40, 42, 45), (40, 40), 20)
         points = [(50, 40), (35, 30), (35, 50)]
         pygame.draw.polygon(surface, (200, 200, 200), points)
 
-    def draw_trails(self, surface):
-        self.trail_surface.fill((0, 0, 0, 0))
-        
-        for i, trail in enumerate(self.trails):
-            if len(trail) < 2:
-                continue
-            
-            for j in range(1, len(trail)):
-                start_pos = trail[j-1][:2]
-                end_pos = trail[j][:2]
-                intensity = trail[j][2]
-                
-                width = max(4, int(8 * intensity))
-                alpha = int(255 * (0.5 + intensity * 0.5))
-                color = (*self.orbs[i]['color'], alpha)
-                
-                pygame.draw.line(self.trail_surface, color, start_pos, end_pos, width)
+    def draw_trails(self, surface, trails=None):
+        if trails is not None:
+            self.trail_surface.fill((0, 0, 0, 0))
+            for i, trail in enumerate(trails):
+                if len(trail) >= 2:
+                    self._draw_trail_runs(i, np.asarray(trail, dtype=np.float64))
+        else:
+            self._update_trail_surface()
         
         surface.blit(self.trail_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
 
-    def draw_orb(self, surface, pos, color, size=4, intensity=1.0):
-        self.glow_surface.fill((0, 0, 0, 0))
+    def _update_trail_surface(self):
+        self._trail_frames += 1
+        if self._trail_frames % TRAIL_FADE_INTERVAL == 0:
+            self.trail_surface.fill((0, 0, 0, TRAIL_FADE_STEP), special_flags=pygame.BLEND_RGBA_SUB)
+        
+        # All orbs append in the same update(), so they share one head
+        head = int(self.trail_head[0])
+        start = max(self._trail_drawn_head - 1, head - TRAIL_LEN, 0)
+        self._trail_drawn_head = head
+        if head - start < 2:
+            return
+        
+        points = self.trails[:, np.arange(start, head) % TRAIL_LEN].astype(np.float64)
+        if head - start > 2:
+            for i in range(self.num_orbs):
+                self._draw_trail_runs(i, points[i])
+            return
+        
+        # Common case, one new segment per orb: style and cull all orbs at once
+        buckets = self._segment_buckets(points)[:, 0]
+        drawn = np.flatnonzero(buckets >= 0)
+        for i, bucket, start_pos, end_pos in zip(drawn.tolist(), buckets[drawn].tolist(),
+                                                 points[drawn, 0, :2].tolist(), points[drawn, 1, :2].tolist()):
+            pygame.draw.line(self.trail_surface, self._trail_colors[i][bucket], start_pos, end_pos,
+                             TRAIL_STYLES[bucket][0])
+
+    def _segment_buckets(self, points):
+        buckets = np.rint(np.clip(points[..., 1:, 2], 0, 1) * (TRAIL_BUCKETS - 1)).astype(np.int32)
         
+        margin = TRAIL_STYLES[-1][0]
+        inside = ((points[..., 0] > -margin) & (points[..., 0] < self.width + margin)
+                  & (points[..., 1] > -margin) & (points[..., 1] < self.height + margin))
+        buckets[~(inside[..., :-1] | inside[..., 1:])] = -1
+        return buckets
+
+    def _draw_trail_runs(self, i, points):
+        buckets = self._segment_buckets(points)
+        breaks = np.flatnonzero(np.diff(buckets)) + 1
+        starts = [0, *breaks.tolist()]
+        ends = [*breaks.tolist(), len(buckets)]
+        
+        for start, end in zip(starts, ends):
+            if buckets[start] < 0:
+                continue
+            width = TRAIL_STYLES[buckets[start]][0]
+            pygame.draw.lines(self.trail_surface, self._trail_colors[i][buckets[start]], False,
+                              points[start:end + 1, :2].tolist(), width)
+
+    def get_glow_sprite(self, color, size, intensity):
+        intensity = max(0.0, round(intensity * GLOW_LEVELS) / GLOW_LEVELS)
+        key = (tuple(color), int(size), intensity)
+        sprite = self._glow_cache.get(key)
+        if sprite is None:
+            sprite = self._to_display_format(self._render_glow(color, size, intensity)).premul_alpha()
+            self._glow_cache[key] = sprite
+        return sprite
+
+    def get_glow_texture(self, color, size, intensity):
+        intensity = max(0.0, round(intensity * GLOW_LEVELS) / GLOW_LEVELS)
+        key = (tuple(color), int(size), intensity)
+        texture = self._glow_textures.get(key)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, self._render_glow(color, size, intensity))
+            self._glow_textures[key] = texture
+        return texture
+
+    def _render_glow(self, color, size, intensity):
         max_radius = int(12 * (1 + intensity * 0.5))
+        extent = max_radius + 1
+        sprite = pygame.Surface((2 * extent, 2 * extent), pygame.SRCALPHA)
+        pos = (extent, extent)
+        
         for r in range(max_radius, 0, -1):
             alpha = int(100 * (r/max_radius) * intensity)
-            pygame.draw.circle(self.glow_surface, (*color, alpha), pos, r)
+            pygame.draw.circle(sprite, (*color, alpha), pos, r)
         
         core_size = int(size * (1 + intensity * 0.3))
-        pygame.draw.circle(self.glow_surface, (*color, 255), pos, core_size)
-        pygame.draw.circle(self.glow_surface, (255, 255, 255, 255), pos, max(1, core_size-1))
-        
-        surface.blit(self.glow_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        pygame.draw.circle(sprite, (*color, 255), pos, core_size)
+        pygame.draw.circle(sprite, (255, 255, 255, 255), pos, max(1, core_size-1))
+        return sprite
+
+    def _to_display_format(self, sprite):
+        if pygame.display.get_surface() is not None:
+            return sprite.convert_alpha()
+        return sprite
+
+    def draw_orb(self, surface, pos, color, size=4, intensity=1.0):
+        sprite = self.get_glow_sprite(color, size, intensity)
+        offset = sprite.get_width() // 2
+        surface.blit(sprite, (pos[0] - offset, pos[1] - offset), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    def blit_sprites(self, surface, blit_seq, special_flags=pygame.BLEND_PREMULTIPLIED):
+        if HAS_FBLITS:
+            surface.fblits(blit_seq, special_flags)
+        else:
+            surface.blits([(sprite, dest, None, special_flags) for sprite, dest in blit_seq], doreturn=False)
 
     def draw_timer(self, surface, category, elapsed_time):
         if not self.screenshot_mode:
-            self.glow_surface.fill((0, 0, 0, 0))
-            pygame.draw.circle(surface, (20, 22, 25, 255), self.center, self.center_orb_radius + 5)
-            
-            minutes = int(elapsed_time.total_seconds() // 60)
-            seconds = int(elapsed_time.total_seconds() % 60)
-            time_text = f"{minutes:02d}:{seconds:02d}"
-            
-            time_surface = self.font_time.render(time_text, True, (255, 255, 255))
-            category_surface = self.font_category.render(category.upper(), True, (200, 200, 200))
-            voice_surface = self.font_voice.render(f"Voice: {self.get_voice_name(category)}", True, (150, 150, 150))
-            
-            time_rect = time_surface.get_rect(center=(self.center[0], self.center[1] - 12))
-            category_rect = category_surface.get_rect(center=(self.center[0], self.center[1] + 12))
-            voice_rect = voice_surface.get_rect(center=(self.center[0], self.center[1] + 32))
-            
-            surface.blit(time_surface, time_rect)
-            surface.blit(category_surface, category_rect)
-            surface.blit(voice_surface, voice_rect)
+            self._refresh_timer_text(category, elapsed_time)
+            surface.blit(self._timer_disc, self._timer_disc_pos)
+            surface.blit(self._cached_time_surface, self._cached_time_rect)
+            surface.blit(self._cached_category_surface, self._cached_category_rect)
+            surface.blit(self._cached_voice_surface, self._cached_voice_rect)
+
+    def _refresh_timer_text(self, category, elapsed_time):
+        total_seconds = int(elapsed_time.total_seconds())
+        
+        if total_seconds != self._cached_time_seconds:
+            self._cached_time_seconds = total_seconds
+            self._cached_time_text = f"{total_seconds // 60:02d}:{total_seconds % 60:02d}"
+            self._cached_time_surface = self.font_time.render(self._cached_time_text, True, (255, 255, 255))
+            self._cached_time_rect = self._cached_time_surface.get_rect(center=(self.center[0], self.center[1] - 12))
+            if self.renderer is not None:
+                self._cached_time_texture = Texture.from_surface(self.renderer, self._cached_time_surface)
+        
+        if category != self._cached_category:
+            self._cached_category = category
+            self._cached_category_surface = self.font_category.render(category.upper(), True, (200, 200, 200))
+            self._cached_voice_surface = self.font_voice.render(f"Voice: {self.get_voice_name(category)}", True, (150, 150, 150))
+            self._cached_category_rect = self._cached_category_surface.get_rect(center=(self.center[0], self.center[1] + 12))
+            self._cached_voice_rect = self._cached_voice_surface.get_rect(center=(self.center[0], self.center[1] + 32))
+            if self.renderer is not None:
+                self._cached_category_texture = Texture.from_surface(self.renderer, self._cached_category_surface)
+                self._cached_voice_texture = Texture.from_surface(self.renderer, self._cached_voice_surface)
+
+    def get_orb_positions(self):
+        radii = self.orbit_radius + self.orb_deviations
+        sin, cos = sincos(self.orb_angles)
+        return self.center[0] + cos * radii, self.center[1] + sin * radii
+
+    def get_orb_pixels(self):
+        xs, ys = self.get_orb_positions()
+        return np.stack([xs, ys], axis=1).astype(np.int32)
+
+    def _visible_sprites(self, topleft, size):
+        visible = ((topleft[:, 0] > -size) & (topleft[:, 0] < self.width)
+                   & (topleft[:, 1] > -size) & (topleft[:, 1] < self.height))
+        return np.flatnonzero(visible)
+
+    def _color_palette(self, colors):
+        palette, index = np.unique(np.asarray(colors, dtype=np.uint8), axis=0, return_inverse=True)
+        return [tuple(color) for color in palette.tolist()], index.reshape(-1)
+
+    def draw_orbs(self, surface, positions, colors, size=4, intensity=1.0):
+        if len(positions) == 0:
+            return
+        palette, index = self._orb_palette if colors is self.orb_colors else self._color_palette(colors)
+        sprites = [self.get_glow_sprite(color, size, intensity) for color in palette]
+        extent = sprites[0].get_width()
+        topleft = np.asarray(positions, dtype=np.int32) - extent // 2
+        visible = self._visible_sprites(topleft, extent)
+        self.blit_sprites(surface, [
+            (sprites[k], dest) for k, dest in zip(index[visible].tolist(), topleft[visible].tolist())
+        ])
 
     def draw(self, screen, category, elapsed_time):
+        if self.renderer is not None:
+            self._draw_gpu(category, elapsed_time)
+            return
+        
         screen.fill((215, 248, 255))
         self.draw_trails(screen)
         
-        for i, orb in enumerate(self.orbs):
-            radius = self.orbit_radius + orb['deviation']
-            pos = (
-                int(self.center[0] + math.cos(orb['angle']) * radius),
-                int(self.center[1] + math.sin(orb['angle']) * radius)
-            )
-            self.draw_orb(screen, pos, self.orbs[i]['color'], 
-                         intensity=1.0 + self.glow_intensity)
+        self.draw_orbs(screen, self.get_orb_pixels(), self.orb_colors, intensity=1.0 + self.glow_intensity)
         
         self.draw_timer(screen, category, elapsed_time)
         if not self.screenshot_mode:
             self.draw_back_button(screen)
 
+    def _draw_gpu(self, category, elapsed_time):
+        self.renderer.draw_color = (215, 248, 255, 255)
+        self.renderer.clear()
+        
+        self._update_trail_surface()
+        self._trail_texture.update(self.trail_surface)
+        self._trail_texture.draw()
+        
+        palette, index = self._orb_palette
+        textures = [self.get_glow_texture(color, 4, 1.0 + self.glow_intensity) for color in palette]
+        extent = textures[0].width
+        topleft = self.get_orb_pixels() - extent // 2
+        visible = self._visible_sprites(topleft, extent)
+        for k, (x, y) in zip(index[visible].tolist(), topleft[visible].tolist()):
+            textures[k].draw(dstrect=(x, y, extent, extent))
+        
+        if not self.screenshot_mode:
+            self._refresh_timer_text(category, elapsed_time)
+            self._timer_disc_texture.draw(dstrect=self._timer_disc_pos)
+            self._cached_time_texture.draw(dstrect=self._cached_time_rect)
+            self._cached_category_texture.draw(dstrect=self._cached_category_rect)
+            self._cached_voice_texture.draw(dstrect=self._cached_voice_rect)
+            self._back_button_texture.draw(dstrect=(0, 0))
+
     def draw_selection(self, screen):
         screen.fill((215, 248, 255))
         spacing = self.height // 4
@@ -189,15 +499,12 @@ class Visualizer:
         for i, category in enumerate(categories):
             pos = (self.width // 2, spacing * (i + 1))
             
-            glow_radius = int(30 * pulse_scale)
-            for r in range(glow_radius, 0, -1):
-                alpha = int(25 * (r/glow_radius))
-                pygame.draw.circle(screen, (*self.orbs[i]['color'], alpha), pos, r)
+            pygame.draw.circle(screen, self.orb_colors[i % self.num_orbs], pos, int(30 * pulse_scale))
             
-            self.draw_orb(screen, pos, self.orbs[i]['color'], size=6)
+            self.draw_orb(screen, pos, self.orb_colors[i % self.num_orbs], size=6)
             
             text = self.font_category.render(category.upper(), True, (255, 255, 255))
-            glow_text = self.font_category.render(category.upper(), True, self.orbs[i]['color'])
+            glow_text = self.font_category.render(category.upper(), True, self.orb_colors[i % self.num_orbs])
             
             text_rect = text.get_rect(center=(pos[0], pos[1] + 40))
             screen.blit(glow_text, text_rect.inflate(4, 4))
@@ -210,11 +517,9 @@ class Visualizer:
         self.trail_surface.set_alpha(self.fade_alpha)
         screen.blit(self.trail_surface, (0, 0))
         
-        for i, orb in enumerate(self.orbs):
-            if len(self.trails[i]) > 0:
-                pos = self.trails[i][-1][:2]
-                self.draw_orb(screen, pos, self.orbs[i]['color'], 
-                            intensity=1-progress)
+        drawn = np.flatnonzero(self.trail_head > 0)
+        positions = self.trails[drawn, (self.trail_head[drawn] - 1) % TRAIL_LEN, :2]
+        self.draw_orbs(screen, positions, self.orb_colors[drawn], intensity=1-progress)
 
     def get_voice_name(self, category):
         voice_names = {
@@ -230,25 +535,27 @@ class Visualizer:
         return None
 
     def reset(self):
-        for orb in self.orbs:
-            orb['deviation'] = 0
-            orb['radial_velocity'] = 0
-            orb['x_velocity'] = 0
-            orb['y_velocity'] = 0
+        self.orb_deviations.fill(0)
+        self.orb_radial_velocities.fill(0)
+        self.orb_x_velocities.fill(0)
+        self.orb_y_velocities.fill(0)
         self.glow_intensity = 0
         self.fade_alpha = 255
         self.screenshot_mode = False
-        self.trails = [[] for _ in range(len(self.orbs))]
+        self.trails.fill(0)
+        self.trail_head.fill(0)
+        self._trail_drawn_head = 0
+        self._trail_frames = 0
+        self.pattern_count = 0
+        self.pattern_stride = 1
+        self._pattern_frames = 0
         
         self.trail_surface.fill((0, 0, 0, 0))
-        self.glow_surface.fill((0, 0, 0, 0))
-        self.blur_surface.fill((0, 0, 0, 0))
+        self.trail_surface.set_alpha(255)
         
     def draw_stored_pattern(self, screen, pattern):
         if isinstance(pattern, dict) and 'trails' in pattern:
-         self.trails = pattern['trails']
-         self.draw_trails(screen)
-         self.trails = [[] for _ in range(len(self.orbs))]
+         self.draw_trails(screen, pattern['trails'])
 
     def cleanup(self):
         pass